@@ -122,7 +122,10 @@ def units_html_list():
     str
         HTML formatted list of all defined units
     """
-    from IPython.display import HTML  # type: ignore
+    try:
+        from IPython.display import HTML  # type: ignore
+    except ImportError as exc:
+        raise ImportError('IPython is required for HTML output, install PhysicalQuantities[notebook]') from exc
     table = "<table>"
     table += "<tr><th>Name</th><th>Base Unit</th><th>Quantity</th></tr>"
     for name in unit_table:
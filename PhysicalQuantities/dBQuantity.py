@@ -233,12 +233,6 @@ class dBQuantity:
             Include conversions to linear and their dB units
         """
         x = list(super().__dir__())
-        # This is required, as strange things happen with IPython...
-        for cruft in ['__builtins__', '__args__']:
-            try:
-                del unit_table[cruft]
-            except KeyError:
-                pass
 
         # add PhysicalUnits and dBUnits that can be converted into
         if self.unit.physicalunit is not None:
@@ -4,7 +4,7 @@
 from math import pi
 
 from .prefixes import addprefixed
-from .unit import add_composite_unit
+from .unit import PhysicalUnit, add_composite_unit, addunit
 
 add_composite_unit('g', 0.001, 'kg', verbosename='Gramm', url='https://en.wikipedia.org/wiki/Kilogram')
 
@@ -25,33 +25,64 @@ addprefixed('cd', prefixrange='engineering')
 addprefixed('rad', prefixrange='engineering')
 addprefixed('sr', prefixrange='engineering')
 
-addprefixed(add_composite_unit('Hz', 1, '1/s', verbosename='Hertz',
-                               url='https://en.wikipedia.org/wiki/Hertz'), prefixrange='engineering')
-addprefixed(add_composite_unit('N', 1, 'm*kg/s**2', verbosename='Newton',
-                               url='https://en.wikipedia.org/wiki/Newton_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('Pa', 1, 'N/m**2', verbosename='Pascal',
-                               url='https://en.wikipedia.org/wiki/Pascal_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('J', 1, 'N*m', verbosename='Joule',
-                               url='https://en.wikipedia.org/wiki/Joule'), prefixrange='engineering')
-addprefixed(add_composite_unit('W', 1, 'J/s', verbosename='Watt',
-                               url='https://en.wikipedia.org/wiki/Watt'), prefixrange='engineering')
-addprefixed(add_composite_unit('C', 1, 's*A', verbosename='Coulomb',
-                               url='https://en.wikipedia.org/wiki/Coulomb'), prefixrange='engineering')
-addprefixed(add_composite_unit('V', 1, 'W/A', verbosename='Volt',
-                               url='https://en.wikipedia.org/wiki/Volt'), prefixrange='engineering')
-addprefixed(add_composite_unit('F', 1, 'C/V', verbosename='Farad',
-                               url='https://en.wikipedia.org/wiki/Farad'), prefixrange='engineering')
-addprefixed(add_composite_unit('Ohm', 1, 'V/A', verbosename='Ohm',
-                               url='https://en.wikipedia.org/wiki/Ohm_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('S', 1, 'A/V', verbosename='Siemens',
-                               url='https://en.wikipedia.org/wiki/Siemens_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('Wb', 1, 'V*s', verbosename='Weber',
-                               url='https://en.wikipedia.org/wiki/Weber_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('T', 1, 'Wb/m**2', verbosename='Tesla',
-                               url='https://en.wikipedia.org/wiki/Tesla_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('H', 1, 'Wb/A', verbosename='Henry',
-                               url='https://en.wikipedia.org/wiki/Henry_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('lm', 1, 'cd*sr', verbosename='Lumen',
-                               url='https://en.wikipedia.org/wiki/Lumen_(unit)'), prefixrange='engineering')
-addprefixed(add_composite_unit('lx', 1, 'lm/m**2', verbosename='Lux',
-                               url='https://en.wikipedia.org/wiki/Lux'), prefixrange='engineering')
+# Derived SI units, given by their powers of the base units to avoid parsing unit strings at import
+addprefixed(addunit(PhysicalUnit('Hz', 1., [0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0],  # 1/s
+                                 url='https://en.wikipedia.org/wiki/Hertz',
+                                 verbosename='Hertz')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('N', 1., [1, 1, -2, 0, 0, 0, 0, 0, 0, 0, 0],  # m*kg/s**2
+                                 url='https://en.wikipedia.org/wiki/Newton_(unit)',
+                                 verbosename='Newton')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('Pa', 1., [-1, 1, -2, 0, 0, 0, 0, 0, 0, 0, 0],  # N/m**2
+                                 url='https://en.wikipedia.org/wiki/Pascal_(unit)',
+                                 verbosename='Pascal')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('J', 1., [2, 1, -2, 0, 0, 0, 0, 0, 0, 0, 0],  # N*m
+                                 url='https://en.wikipedia.org/wiki/Joule',
+                                 verbosename='Joule')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('W', 1., [2, 1, -3, 0, 0, 0, 0, 0, 0, 0, 0],  # J/s
+                                 url='https://en.wikipedia.org/wiki/Watt',
+                                 verbosename='Watt')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('C', 1., [0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 0],  # s*A
+                                 url='https://en.wikipedia.org/wiki/Coulomb',
+                                 verbosename='Coulomb')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('V', 1., [2, 1, -3, -1, 0, 0, 0, 0, 0, 0, 0],  # W/A
+                                 url='https://en.wikipedia.org/wiki/Volt',
+                                 verbosename='Volt')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('F', 1., [-2, -1, 4, 2, 0, 0, 0, 0, 0, 0, 0],  # C/V
+                                 url='https://en.wikipedia.org/wiki/Farad',
+                                 verbosename='Farad')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('Ohm', 1., [2, 1, -3, -2, 0, 0, 0, 0, 0, 0, 0],  # V/A
+                                 url='https://en.wikipedia.org/wiki/Ohm_(unit)',
+                                 verbosename='Ohm')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('S', 1., [-2, -1, 3, 2, 0, 0, 0, 0, 0, 0, 0],  # A/V
+                                 url='https://en.wikipedia.org/wiki/Siemens_(unit)',
+                                 verbosename='Siemens')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('Wb', 1., [2, 1, -2, -1, 0, 0, 0, 0, 0, 0, 0],  # V*s
+                                 url='https://en.wikipedia.org/wiki/Weber_(unit)',
+                                 verbosename='Weber')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('T', 1., [0, 1, -2, -1, 0, 0, 0, 0, 0, 0, 0],  # Wb/m**2
+                                 url='https://en.wikipedia.org/wiki/Tesla_(unit)',
+                                 verbosename='Tesla')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('H', 1., [2, 1, -2, -2, 0, 0, 0, 0, 0, 0, 0],  # Wb/A
+                                 url='https://en.wikipedia.org/wiki/Henry_(unit)',
+                                 verbosename='Henry')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('lm', 1., [0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0],  # cd*sr
+                                 url='https://en.wikipedia.org/wiki/Lumen_(unit)',
+                                 verbosename='Lumen')),
+            prefixrange='engineering')
+addprefixed(addunit(PhysicalUnit('lx', 1., [-2, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0],  # lm/m**2
+                                 url='https://en.wikipedia.org/wiki/Lux',
+                                 verbosename='Lux')),
+            prefixrange='engineering')
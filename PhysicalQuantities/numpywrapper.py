@@ -2,7 +2,7 @@ import numpy as np
 from typing import Union
 from . import isphysicalquantity, q
 from .quantity import *
-from .unit import UnitError
+from .unit import UnitError, findunit
 
 __all__ = ['max', 'floor', 'ceil', 'sqrt', 'linspace', 'tophysicalquantity']
 
@@ -26,13 +26,15 @@ def max(qu: Union[np.ndarray, PhysicalQuantity]):
         return np.max(qu)
 
     
-def floor(qu: Union[np.ndarray, PhysicalQuantity]):
+def floor(qu: Union[np.ndarray, PhysicalQuantity], out: np.ndarray | None = None):
     """ Return the floor of the input, element-wise.
 
     Parameters
     ----------
     qu:
         Input data
+    out:
+        Optional array to store the result in, avoids allocating a new array
 
     Returns
     -------
@@ -46,18 +48,20 @@ def floor(qu: Union[np.ndarray, PhysicalQuantity]):
     1 mm
     """
     if isinstance(qu, PhysicalQuantity):
-        return qu.__class__(np.floor(qu.value), qu.unit)  # type: ignore
+        return qu.__class__(np.floor(qu.value, out=out), qu.unit)  # type: ignore
     else:
-        return np.floor(qu)
+        return np.floor(qu, out=out)
 
 
-def ceil(qu: Union[np.ndarray, PhysicalQuantity]):
+def ceil(qu: Union[np.ndarray, PhysicalQuantity], out: np.ndarray | None = None):
     """ Return the ceiling of the input, element-wise.
 
     Parameters
     ----------
     qu:
         Input data
+    out:
+        Optional array to store the result in, avoids allocating a new array
 
     Returns
     -------
@@ -71,9 +75,43 @@ def ceil(qu: Union[np.ndarray, PhysicalQuantity]):
     2.0 mm
     """
     if isinstance(qu, PhysicalQuantity):
-        return qu.__class__(np.ceil(qu.value), qu.unit)  # type: ignore
+        return qu.__class__(np.ceil(qu.value, out=out), qu.unit)  # type: ignore
     else:
-        return np.ceil(qu)
+        return np.ceil(qu, out=out)
+
+
+# Cached square roots of units, indexed by id of the unit
+_sqrt_units: dict[int, tuple[PhysicalUnit, PhysicalUnit]] = {}
+
+
+def _sqrt_unit(unit: PhysicalUnit) -> PhysicalUnit:
+    """ Return the square root of a unit
+
+    Parameters
+    ----------
+    unit:
+        Unit to take the square root of
+
+    Returns
+    -------
+    PhysicalUnit
+        Square root of the unit
+
+    Notes
+    -----
+    Results are cached, as the float exponent in `unit ** 0.5` is expensive. The cache is keyed on the unit object
+    instead of its value, so units with equal values but different names keep their own names.
+    """
+    try:
+        return _sqrt_units[id(unit)][1]
+    except KeyError:
+        pass
+    sqrt_unit = unit ** 0.5  # type: ignore
+    if len(_sqrt_units) >= 128:
+        _sqrt_units.clear()
+    # keep a reference to the unit, so its id cannot be reused while cached
+    _sqrt_units[id(unit)] = (unit, sqrt_unit)
+    return sqrt_unit
 
 
 def sqrt(qu: Union[np.ndarray, PhysicalQuantity]):
@@ -97,7 +135,7 @@ def sqrt(qu: Union[np.ndarray, PhysicalQuantity]):
     """
     if isinstance(qu, PhysicalQuantity):
         value = np.sqrt(qu.value)  # type: ignore
-        return qu.__class__(value, qu.unit ** 0.5)  # type: ignore
+        return qu.__class__(value, _sqrt_unit(qu.unit))  # type: ignore
     else:
         return np.sqrt(qu)
 
@@ -130,8 +168,9 @@ def linspace(start, stop, num=50,  endpoint=True, retstep=False):
     if not isinstance(start, PhysicalQuantity) and not isinstance(stop, PhysicalQuantity):
         return np.linspace(start, stop, num,  endpoint, retstep)
 
-    if isinstance(start, PhysicalQuantity) and isinstance(stop, PhysicalQuantity):
-        start.base.unit == stop.base.unit
+    if isinstance(start, PhysicalQuantity) and isinstance(stop, PhysicalQuantity) and stop.unit is not start.unit:
+        # raises UnitError for incompatible units
+        stop = stop.to(start.unit)
 
     unit = None
     if isinstance(start, PhysicalQuantity):
@@ -202,17 +241,37 @@ def tophysicalquantity(arr: np.ndarray | PhysicalQuantity, unit=None):
 
     if unit is None:
         unit = arr[0].unit
+    unit = findunit(unit)
     valuetype = type(arr[0].value)
 
-    newarr = np.zeros_like(arr, dtype=valuetype)
+    # collect values and conversion tuples, then convert all elements at once
+    values = []
+    factors = np.empty(len(arr))
+    offsets = np.zeros(len(arr))
     for i, _a in enumerate(arr):
-        if isphysicalquantity(_a):
+        if isinstance(_a, PhysicalQuantity):
+            try:
+                factors[i], offsets[i] = _a.unit.conversion_tuple_to(unit)
+            except UnitError:
+                raise UnitError('Element %d is not same unit as others' % i)
+            values.append(_a.value)
+        elif isphysicalquantity(_a):
             try:
-                newarr[i] = _a.to(unit).value
+                values.append(_a.to(unit).value)
             except UnitError:
                 raise UnitError('Element %d is not same unit as others' % i)
+            factors[i] = 1.
         else:
-            newarr[i] = _a
+            values.append(_a)
+            factors[i] = 1.
+    newarr = np.array(values)
+    # apply one factor per element, even if the elements are arrays themselves
+    shape = (len(arr),) + (1,) * (newarr.ndim - 1)
+    if offsets.any():
+        newarr = newarr + offsets.reshape(shape)
+    newarr = np.multiply(newarr, factors.reshape(shape))
+    if not issubclass(valuetype, np.ndarray):
+        newarr = newarr.astype(valuetype, copy=False)
     return PhysicalQuantity(newarr, unit)  # type: ignore
 
 
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from .quantity import unit_table
-from .unit import add_composite_unit
+from .unit import addunit
 
 # add scaling prefixes
 _full_prefixes = [
@@ -36,8 +36,7 @@ def addprefixed(unitname, prefixrange='full'):
     else:
         _prefixes = _full_prefixes
     unit = unit_table[unitname]
-    for prefix in _prefixes:
-        prefixedname = prefix[0] + unitname
+    for prefix, factor in _prefixes:
+        prefixedname = prefix + unitname
         if prefixedname not in unit_table:
-            add_composite_unit(prefixedname, prefix[1], unitname, prefixed=True, verbosename=unit.verbosename,
-                    url=unit.url)
+            addunit(unit._clone_scaled(factor, prefixedname))
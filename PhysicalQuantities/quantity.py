@@ -657,9 +657,7 @@ class PhysicalQuantity:
         new_value = (self.value+self.unit.offset) * self.unit.factor
         num = ''
         denom = ''
-        for i in range(len(base_names)):
-            unit = base_names[i]
-            power = self.unit.powers[i]
+        for unit, power in zip(base_names, self.unit.powers):
             if power < 0:
                 denom += '/' + unit
                 if power < -1:
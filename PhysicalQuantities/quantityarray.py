@@ -132,9 +132,7 @@ class PhysicalQuantityArray(ndarray):
     def base(self) -> PhysicalQuantityArray:
         num = ''
         denom = ''
-        for i in range(len(base_names)):
-            unit = base_names[i]
-            power = self.unit.powers[i]
+        for unit, power in zip(base_names, self.unit.powers):
             if power < 0:
                 denom += '/' + unit
                 if power < -1:
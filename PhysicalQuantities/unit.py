@@ -6,12 +6,13 @@ from __future__ import annotations
 from __future__ import annotations
 import copy
 import json
-from functools import reduce, lru_cache
-from typing import Dict
+import re
+from functools import lru_cache, partial
+from math import floor
+from operator import add, sub
+from typing import Dict, Sequence
 from fractions import Fraction
 
-import numpy as np
-
 from .fractdict import FractionalDict
 
 
@@ -19,8 +20,19 @@ class UnitError(ValueError):
     pass
 
 
+# Replacements for displaying unit names as markdown/LaTeX
+_MARKDOWN_REPLACEMENTS = (('\\text{deg}', '\\,^{\\circ}'), (' pi', ' \\pi '))
+
+
 class PhysicalUnit:
-    prefixed: bool = False
+    __slots__ = ('prefixed', 'baseunit', 'verbosename', 'url', 'unece_code', '_names', '_lazy_names', '_name_cache',
+                 '_str_cache', '_markdown_cache', 'factor', 'offset', 'powers')
+    prefixed: bool
+    _names: FractionalDict | None
+    _lazy_names: partial[FractionalDict] | None
+    _name_cache: str | None
+    _str_cache: str | None
+    _markdown_cache: str | None
     """Physical unit.
 
     A physical unit is defined by a name (possibly composite), a scaling factor, and the exponentials of each of
@@ -37,8 +49,8 @@ class PhysicalUnit:
         for M{m/s})
     factor: float
         A scaling factor from base units
-    powers: list
-        The integer powers for each of the nine base units:
+    powers: tuple
+        The integer powers for each of the base units:
         ['m', 'kg', 's', 'A', 'K', 'mol', 'cd', 'rad', 'sr']
     offset: float
         An additive offset to the unit (used only for temperatures)
@@ -52,7 +64,7 @@ class PhysicalUnit:
 
     """
 
-    def __init__(self, names, factor: float, powers: list[int], offset: float = 0, url: str = '', verbosename: str = '',
+    def __init__(self, names, factor: float, powers: Sequence[int], offset: float = 0, url: str = '', verbosename: str = '',
                  unece_code: str = ''):
         """ Initialize object
 
@@ -64,7 +76,7 @@ class PhysicalUnit:
         factor:
             A scaling factor from base units
         powers:
-            The integer powers for each of the nine base units:
+            The integer powers for each of the base units:
             ['m', 'kg', 's', 'A', 'K', 'mol', 'cd', 'rad', 'sr']
         offset:
             An additive offset to the unit (used only for temperatures)
@@ -77,9 +89,11 @@ class PhysicalUnit:
             (see https://www.unece.org/fileadmin/DAM/cefact/recommendations/rec20/rec20_Rev9e_2014.xls)
 
         """
+        self.prefixed = False
         self.baseunit = self
         self.verbosename = verbosename
         self.url = url
+        self._lazy_names = None
         if isinstance(names, str):
             self.names = FractionalDict()
             self.names[names] = 1
@@ -91,9 +105,93 @@ class PhysicalUnit:
         self.offset = offset
         if len(base_names) != len(powers):
             raise ValueError('Invalid number of powers given for existing base_names')
-        self.powers = powers
+        self.powers = tuple(powers)
         self.unece_code = unece_code
 
+    @staticmethod
+    def _from_powers(factor: float, powers: tuple[int, ...], names: partial[FractionalDict]) -> PhysicalUnit:
+        """ Create unit from already validated powers, used for unit arithmetic
+
+        Parameters
+        ----------
+        factor:
+            A scaling factor from base units
+        powers:
+            The integer powers for each of the base units
+        names:
+            Function returning the names of the unit from the operand names, only called when the names are needed
+
+        Returns
+        -------
+        PhysicalUnit
+            New unit without offset
+        """
+        unit = PhysicalUnit.__new__(PhysicalUnit)
+        unit.prefixed = False
+        unit.baseunit = unit
+        unit.verbosename = ''
+        unit.url = ''
+        unit.unece_code = ''
+        unit._names = None
+        unit._lazy_names = names
+        unit._name_cache = None
+        unit._str_cache = None
+        unit._markdown_cache = None
+        unit.factor = factor
+        unit.offset = 0
+        unit.powers = powers
+        return unit
+
+    def _clone_scaled(self, factor: float, name: str) -> PhysicalUnit:
+        """ Return a prefixed copy of the unit, scaled by a factor
+
+        Parameters
+        ----------
+        factor:
+            Scaling factor of the prefix
+        name:
+            Name of the prefixed unit
+
+        Returns
+        -------
+        PhysicalUnit
+            Prefixed unit with this unit as base unit
+        """
+        unit = PhysicalUnit.__new__(PhysicalUnit)
+        unit.baseunit = self
+        unit.prefixed = True
+        unit.verbosename = self.verbosename
+        unit.url = self.url
+        unit.unece_code = self.unece_code
+        unit._lazy_names = None
+        unit.names = FractionalDict({name: 1})
+        unit.factor = self.factor * factor
+        unit.offset = self.offset
+        unit.powers = self.powers
+        return unit
+
+    @property
+    def names(self) -> FractionalDict:
+        """ Return names of unit components and their powers
+
+        Returns
+        -------
+        FractionalDict
+            Names of unit components mapped to their powers
+        """
+        if self._names is None:
+            self._names = self._lazy_names()  # type: ignore
+            self._lazy_names = None
+        return self._names
+
+    @names.setter
+    def names(self, names: FractionalDict):
+        self._names = names
+        self._lazy_names = None
+        self._name_cache = None
+        self._str_cache = None
+        self._markdown_cache = None
+
     def set_name(self, name):
         """Set unit name as FractionalDict
 
@@ -102,8 +200,7 @@ class PhysicalUnit:
         name: str
             Unit name
         """
-        self.names = FractionalDict()
-        self.names[name] = 1
+        self.names = FractionalDict({name: 1})
 
     @property
     def name(self) -> str:
@@ -114,24 +211,30 @@ class PhysicalUnit:
         str
             Name of unit
 
+        Notes
+        -----
+        The name is cached, it has to be changed using `set_name()`
         """
-        num = ''
-        denom = ''
-        for unit in self.names.keys():
-            power = self.names[unit]
+        if self._name_cache is not None:
+            return self._name_cache
+        num = []
+        denom = []
+        for unit, power in self.names.items():
             if power < 0:
-                denom = denom + '/' + unit
+                denom.append('/' + unit)
                 if power < -1:
-                    denom = denom + '**' + str(-power)
+                    denom.append('**' + str(-power))
             elif power > 0:
-                num = num + '*' + unit
+                num.append('*' + unit)
                 if power > 1:
-                    num = num + '**' + str(power)
-        if len(num) == 0:
-            num = '1'
+                    num.append('**' + str(power))
+        if num:
+            name = ''.join(num)[1:]
         else:
-            num = num[1:]
-        return num + denom
+            name = '1'
+        name += ''.join(denom)
+        self._name_cache = name
+        return name
 
     @property
     def _markdown_name(self) -> str:
@@ -143,6 +246,8 @@ class PhysicalUnit:
             Name of unit as markdown string
 
         """
+        if self._markdown_cache is not None:
+            return self._markdown_cache
         num = ''
         denom = ''
         for unit in self.names.keys():
@@ -167,7 +272,9 @@ class PhysicalUnit:
             name = '\\frac{' + num + '}{' + denom + '}'
         else:
             name = num
-        name = name.replace('\\text{deg}', '\\,^{\\circ}').replace(' pi', ' \\pi ')
+        for old, new in _MARKDOWN_REPLACEMENTS:
+            name = name.replace(old, new)
+        self._markdown_cache = name
         return name
 
     @property
@@ -181,7 +288,7 @@ class PhysicalUnit:
             True if it is a power unit, i.e. W, J or anything like it
         """
         p = self.powers
-        if p == [2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]:
+        if p == (2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0):
             return True  # for m^ -> dBsm
         if p[0] == 2 and p[1] == 1 and p[3] > -1:
             return True
@@ -196,7 +303,7 @@ class PhysicalUnit:
         bool
             True if dimensionless
         """
-        return not reduce(lambda a, b: a or b, self.powers)
+        return not any(self.powers)
 
     @property
     def is_angle(self) -> bool:
@@ -207,7 +314,7 @@ class PhysicalUnit:
         bool
             True if unit is an angle
         """
-        return self.powers[7] == 1 and reduce(lambda a, b: a + b, self.powers) == 1
+        return self.powers[7] == 1 and sum(self.powers) == 1
 
     def __str__(self) -> str:
         """ Return string text representation of unit
@@ -217,8 +324,9 @@ class PhysicalUnit:
         str
             Text representation of unit
         """
-        name = self.name.strip().replace('**', u'^')
-        return name
+        if self._str_cache is None:
+            self._str_cache = self.name.strip().replace('**', '^')
+        return self._str_cache
 
     def __repr__(self) -> str:
         return '<PhysicalUnit ' + self.name + '>'
@@ -282,7 +390,7 @@ class PhysicalUnit:
         bool
             True, if unit is greater than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isinstance(other, PhysicalUnit) and self.powers == other.powers:
             return self.factor > other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -299,7 +407,7 @@ class PhysicalUnit:
         bool
             True, if unit is greater or equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isinstance(other, PhysicalUnit) and self.powers == other.powers:
             return self.factor >= other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -316,7 +424,7 @@ class PhysicalUnit:
         bool
             True, if unit is less than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isinstance(other, PhysicalUnit) and self.powers == other.powers:
             return self.factor < other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -333,7 +441,7 @@ class PhysicalUnit:
         bool
             True, if unit is less or equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isinstance(other, PhysicalUnit) and self.powers == other.powers:
             return self.factor <= other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -350,7 +458,7 @@ class PhysicalUnit:
         bool
             True, if unit is equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isinstance(other, PhysicalUnit) and self.powers == other.powers:
             return self.factor == other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -373,20 +481,20 @@ class PhysicalUnit:
         >>> q.m.unit * q.s.unit
         m*s
         """
-        from .quantity import PhysicalQuantity
-        if self.offset != 0 or (isphysicalunit(other) and other.offset != 0):
+        if self.offset != 0 or (isinstance(other, PhysicalUnit) and other.offset != 0):
             raise UnitError(f'Cannot multiply units {self} and {other} with non-zero offset')
-        if isphysicalunit(other):
-            return PhysicalUnit(self.names + other.names,
-                                self.factor * other.factor,
-                                list(map(lambda a, b: a + b, self.powers, other.powers)))
-        elif isinstance(other, PhysicalQuantity):
+        if isinstance(other, PhysicalUnit):
+            return PhysicalUnit._from_powers(self.factor * other.factor,
+                                             tuple(map(add, self.powers, other.powers)),
+                                             partial(FractionalDict.__add__, self.names, other.names))
+        # import only after the unit-unit case, the import statement is slow compared to unit arithmetic
+        from .quantity import PhysicalQuantity
+        if isinstance(other, PhysicalQuantity):
             other = other.unit
-            newpowers = [a + b for a, b in zip(other.powers, self.powers)]
+            newpowers = tuple(map(add, other.powers, self.powers))
             return PhysicalUnit(self.names + FractionalDict({str(other): 1}),
                                 self.factor * other.factor, newpowers, self.offset)
-        else:
-            return PhysicalQuantity(other, self)
+        return PhysicalQuantity(other, self)
 
     __rmul__ = __mul__
 
@@ -409,33 +517,32 @@ class PhysicalUnit:
         >>> q.m.unit / q.s.unit
         m/s
         """
-        from .quantity import PhysicalQuantity
-        if self.offset != 0 or (isphysicalunit(other) and other.offset != 0):
+        if self.offset != 0 or (isinstance(other, PhysicalUnit) and other.offset != 0):
             raise UnitError(f'Cannot divide units {self} and {other} with non-zero offset')
-        if isphysicalunit(other):
-            return PhysicalUnit(self.names - other.names,
-                                self.factor / other.factor,
-                                list(map(lambda a, b: a - b, self.powers, other.powers)))
-        elif isinstance(other, PhysicalQuantity):
+        if isinstance(other, PhysicalUnit):
+            return PhysicalUnit._from_powers(self.factor / other.factor,
+                                             tuple(map(sub, self.powers, other.powers)),
+                                             partial(FractionalDict.__sub__, self.names, other.names))
+        from .quantity import PhysicalQuantity
+        if isinstance(other, PhysicalQuantity):
             other = other.unit
-            newpowers = [a - b for a, b in zip(other.powers, self.powers)]
+            newpowers = tuple(map(sub, other.powers, self.powers))
             return PhysicalUnit(self.names + FractionalDict({str(other): 1}),
                                 self.factor / other.factor, newpowers)
-        else:
-            return PhysicalUnit(self.names + FractionalDict({str(other): -1}),
-                                self.factor/other.factor, self.powers)
+        return PhysicalUnit(self.names + FractionalDict({str(other): -1}),
+                            self.factor/other.factor, self.powers)
 
     def __rdiv__(self, other):
-        if self.offset != 0 or (isphysicalunit(other) and other.offset != 0):
+        if self.offset != 0 or (isinstance(other, PhysicalUnit) and other.offset != 0):
             raise UnitError('Cannot divide units %s and %s with non-zero offset' % (self, other))
-        if isphysicalunit(other):
-            return PhysicalUnit(other.names - self.names,
-                                other.factor / self.factor,
-                                list(map(lambda a, b: a - b, other.powers, self.powers)))
+        if isinstance(other, PhysicalUnit):
+            return PhysicalUnit._from_powers(other.factor / self.factor,
+                                             tuple(map(sub, other.powers, self.powers)),
+                                             partial(FractionalDict.__sub__, other.names, self.names))
         else:
             return PhysicalUnit(FractionalDict({str(other): 1}) - self.names,
                                 other / self.factor,
-                                list(map(lambda x: -x, self.powers)))
+                                tuple(-x for x in self.powers))
 
     def __floordiv__(self, other):
         """ Divide two units
@@ -456,12 +563,12 @@ class PhysicalUnit:
         >>> q.m.unit / q.s.unit
         m/s
         """
-        if self.offset != 0 or (isphysicalunit(other) and other.offset != 0):
+        if self.offset != 0 or (isinstance(other, PhysicalUnit) and other.offset != 0):
             raise UnitError(f'Cannot divide units {self} and {other} with non-zero offset')
-        if isphysicalunit(other):
-            return PhysicalUnit(self.names - other.names,
-                                self.factor // other.factor,
-                                list(map(lambda a, b: a - b, self.powers, other.powers)))
+        if isinstance(other, PhysicalUnit):
+            return PhysicalUnit._from_powers(self.factor // other.factor,
+                                             tuple(map(sub, self.powers, other.powers)),
+                                             partial(FractionalDict.__sub__, self.names, other.names))
         else:
             # TODO: add test
             return PhysicalUnit(self.names + FractionalDict({str(other): -1}),
@@ -492,31 +599,54 @@ class PhysicalUnit:
         if self.offset != 0:
             raise UnitError('Cannot exponentiate units %s and %s with non-zero offset' % (self, exponent))
         if isinstance(exponent, int):
-            y = lambda x, _p=exponent: x * _p
-            p = list(map(y, self.powers))
+            p = tuple(x * exponent for x in self.powers)
             f = pow(self.factor, exponent)
-            names = FractionalDict((k, self.names[k] * Fraction(exponent, 1)) for k in self.names)
-            return PhysicalUnit(names, f, p)
+            return PhysicalUnit._from_powers(f, p, partial(FractionalDict.__mul__, self.names, Fraction(exponent, 1)))
         elif isinstance(exponent, float):
             inv_exp = 1. / exponent
-            rounded = int(np.floor(inv_exp + 0.5))
-            if abs(inv_exp - rounded) < 1.e-10:
-                if all(x % rounded == 0 for x in self.powers):
+            rounded = floor(inv_exp + 0.5)
+            if rounded != 0 and abs(inv_exp - rounded) < 1.e-10:
+                pwr = self.powers
+                if all(x % rounded == 0 for x in pwr):
                     f = pow(self.factor, exponent)
-                    p = [int(x / rounded) for x in self.powers]
+                    p = tuple(x // rounded for x in pwr)
                     if all(x % rounded == 0 for x in self.names.values()):
                         names = FractionalDict((k, v / rounded) for k, v in self.names.items())
                     else:
                         names = FractionalDict({str(f): 1} if f != 1. else {})
-                        names.update({base_names[i]: p_i for i, p_i in enumerate(p)})
+                        names.update(zip(base_names, p))
                     return PhysicalUnit(names, f, p)
                 else:
                     raise UnitError('Illegal exponent %f' % exponent)
         raise UnitError('Only integer and inverse integer exponents allowed')
 
+    def __getstate__(self) -> dict:
+        """ Return state of the unit for pickling and copying, also used by pickle protocols 0 and 1
+
+        Returns
+        -------
+        dict
+            Slot values of the unit, with resolved names
+        """
+        state = {name: getattr(self, name) for name in self.__slots__ if name != '_lazy_names'}
+        state['_names'] = self.names
+        return state
+
+    def __setstate__(self, state: dict):
+        """ Restore state of the unit from __getstate__
+
+        Parameters
+        ----------
+        state: dict
+            Slot values of the unit
+        """
+        self._lazy_names = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __hash__(self):
         """Custom hash function"""
-        return hash((self.factor, self.offset, str(self.powers)))
+        return hash((self.factor, self.offset, self.powers))
 
     def conversion_factor_to(self, other):
         """Return conversion factor to another unit
@@ -537,8 +667,12 @@ class PhysicalUnit:
         >>> q.km.unit.conversion_factor_to(q.m.unit)
         1000.0
         """
+        if self is other:
+            return 1.0
         if self.powers != other.powers:
             raise UnitError('Incompatible units')
+        if self.factor == other.factor and self.offset == other.offset:
+            return 1.0
         if self.offset != other.offset and self.factor != other.factor:
             raise UnitError(('Unit conversion (%s to %s) cannot be expressed ' +
                              'as a simple multiplicative factor') %
@@ -563,7 +697,18 @@ class PhysicalUnit:
         >>> from PhysicalQuantities import q
         >>> q.km.unit.conversion_tuple_to(q.m.unit)
         (1000.0, 0.0)
+
+        Notes
+        -----
+        Results are cached per pair of unit objects, units are not expected to change after being defined.
         """
+        if self is other:
+            return 1.0, 0.0
+        key = (id(self), id(other))
+        try:
+            return _conversion_cache[key][2]
+        except KeyError:
+            pass
         if self.powers != other.powers:
             raise UnitError(f'Incompatible unit for conversion from {self} to {other}')
 
@@ -584,6 +729,10 @@ class PhysicalUnit:
         # thus, D = d1 - d2*s2/s1 and S = s1/s2
         factor = self.factor / other.factor
         offset = self.offset - (other.offset * other.factor / self.factor)
+        if len(_conversion_cache) >= _CONVERSION_CACHE_SIZE:
+            _conversion_cache.clear()
+        # keep references to both units, so their ids cannot be reused while cached
+        _conversion_cache[key] = (self, other, (factor, offset))
         return factor, offset
 
     @property
@@ -605,12 +754,7 @@ class PhysicalUnit:
                      'offset': self.offset,
                      'factor': self.factor
                      }
-        b = self.baseunit
-        p = b.powers
-        base_dict = {}
-        for i, exponent in enumerate(p):
-            base_dict[base_names[i]] = exponent
-        unit_dict['base_exponents'] = base_dict
+        unit_dict['base_exponents'] = dict(zip(base_names, self.baseunit.powers))
         return unit_dict
 
     @property
@@ -668,6 +812,172 @@ class PhysicalUnit:
         return PhysicalUnit.from_dict(unit_dict['PhysicalUnit'])
 
 
+# Tokens of unit strings: operators, unit names and numbers
+_UNIT_TOKEN = re.compile(r'\s*(?:(\*\*|[*/()+-])|([^\W\d]\w*)|(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?))')
+
+
+class _UnsupportedSyntax(Exception):
+    """Unit string cannot be handled by _UnitParser"""
+
+
+class _UnitParser:
+    """ Parser for unit strings like 'm*kg/s**2' or '(m/s)**-1'
+
+    Only unit names, '*', '/', parentheses and numeric exponents are supported, the units are looked up in the
+    unit_table and combined using the PhysicalUnit operators. Any other syntax raises _UnsupportedSyntax.
+    """
+
+    def __init__(self, text: str):
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _UNIT_TOKEN.match(text, pos)
+            if match is None:
+                raise _UnsupportedSyntax(text)
+            operator, unitname, number = match.groups()
+            if operator is not None:
+                self.tokens.append(('op', operator))
+            elif unitname is not None:
+                self.tokens.append(('name', unitname))
+            else:
+                self.tokens.append(('number', number))
+            pos = match.end()
+        self.pos = 0
+
+    def _next(self) -> tuple[str, str] | None:
+        """Return next token without consuming it"""
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None
+
+    def _take(self) -> tuple[str, str]:
+        """Consume and return next token"""
+        token = self._next()
+        if token is None:
+            raise _UnsupportedSyntax('Unexpected end of unit string')
+        self.pos += 1
+        return token
+
+    def parse(self):
+        """ Parse the unit string
+
+        Raises
+        ------
+        NameError
+            If a unit name is not defined
+        _UnsupportedSyntax
+            If the unit string contains unsupported syntax
+        """
+        result = self._expression()
+        if self._next() is not None:
+            raise _UnsupportedSyntax('Unexpected token %s' % self._next()[1])  # type: ignore
+        return result
+
+    def _expression(self):
+        """expression := power (('*' | '/') power)*"""
+        result = self._power()
+        while self._next() in (('op', '*'), ('op', '/')):
+            operator = self._take()[1]
+            if operator == '*':
+                result = result * self._power()
+            else:
+                result = result / self._power()
+        return result
+
+    def _power(self):
+        """power := atom ['**' ['+' | '-'] number]"""
+        result = self._atom()
+        if self._next() == ('op', '**'):
+            self._take()
+            sign = ''
+            if self._next() in (('op', '-'), ('op', '+')):
+                sign = self._take()[1]
+            kind, number = self._take()
+            if kind != 'number' or self._next() == ('op', '**'):
+                raise _UnsupportedSyntax(number)
+            text = sign + number
+            result = result ** (int(text) if text.lstrip('+-').isdigit() else float(text))
+        return result
+
+    def _atom(self):
+        """atom := name | '(' expression ')'"""
+        kind, value = self._take()
+        if kind == 'name':
+            try:
+                return unit_table[value]
+            except KeyError:
+                raise NameError(f"name '{value}' is not defined") from None
+        if (kind, value) == ('op', '('):
+            result = self._expression()
+            if self._take() != ('op', ')'):
+                raise _UnsupportedSyntax('Missing closing parenthesis')
+            return result
+        raise _UnsupportedSyntax(value)
+
+
+def _evaluate_units(units: str):
+    """ Evaluate a unit string against the unit_table
+
+    Parameters
+    ----------
+    units: str
+        Unit string, e.g. 'm*kg/s**2'
+
+    Returns
+    -------
+    any
+        Result of the evaluated unit string
+
+    Notes
+    -----
+    Unit strings are parsed by _UnitParser, eval() is only used for unsupported syntax.
+    """
+    try:
+        return _UnitParser(units).parse()
+    except _UnsupportedSyntax:
+        return eval(units, _eval_globals, unit_table)
+
+
+@lru_cache(maxsize=1024)
+def _parse_unit(unitname: str):
+    """ Evaluate a unit string against the unit_table
+
+    Parameters
+    ----------
+    unitname: str
+        Unit string, e.g. 'mm' or 'm/s^2'
+
+    Returns
+    -------
+    any
+        Result of the evaluated unit string
+
+    Raises
+    ------
+    UnitError
+        If the unit string contains an unknown unit.
+
+    Notes
+    -----
+    The results are cached, so the cache has to be cleared whenever the unit_table is modified.
+    """
+    name = unitname.strip().replace('^', '**')
+    if name.startswith('1/'):
+        name = '(' + name[2:] + ')**-1'
+    try:
+        unit = _evaluate_units(name)
+    except NameError:
+        raise UnitError('Invalid or unknown unit %s' % name) from None
+    return unit
+
+
+def _clear_caches():
+    """ Clear cached unit lookups and conversions after the unit_table was modified"""
+    _parse_unit.cache_clear()
+    _conversion_cache.clear()
+
+
 def addunit(unit):
     """ Add new PhysicalUnit entry to the unit_table
 
@@ -676,6 +986,11 @@ def addunit(unit):
     unit: Physicalunit
         PhysicalUnit object
 
+    Returns
+    -------
+    str
+        Name of new unit
+
     Raises
     ------
     KeyError
@@ -685,11 +1000,19 @@ def addunit(unit):
     if unit.name in unit_table:
         raise KeyError(f'Unit {unit.name} already defined')
     unit_table[unit.name] = unit
+    _clear_caches()
+
+    return unit.name
 
 
 unit_table: Dict[str, PhysicalUnit] = {}
+# Cached conversion tuples, indexed by the ids of source and target unit
+_conversion_cache: Dict[tuple[int, int], tuple[PhysicalUnit, PhysicalUnit, tuple[float, float]]] = {}
+_CONVERSION_CACHE_SIZE = 4096
+# Globals for evaluating unit strings, unit_table is passed as locals so eval() does not insert __builtins__ into it
+_eval_globals: dict = {'__builtins__': {}}
 # These are predefined base units 
-base_names = ['m', 'kg', 's', 'A', 'K', 'mol', 'cd', 'rad', 'sr', 'Bit', 'currency']
+base_names = ('m', 'kg', 's', 'A', 'K', 'mol', 'cd', 'rad', 'sr', 'Bit', 'currency')
 
 addunit(PhysicalUnit('m', 1., [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
         url='https://en.wikipedia.org/wiki/Metre', verbosename='Metre',
@@ -762,7 +1085,7 @@ def add_composite_unit(name, factor, units, offset=0, verbosename='', prefixed=F
         raise KeyError(f'Unit {name} already defined')
     # Parse composed units string
     try:
-        baseunit = eval(units, unit_table)
+        baseunit = _evaluate_units(units)
     except (SyntaxError, ValueError):
         raise KeyError(f'Invalid units string: {units}')
 
@@ -771,10 +1094,6 @@ def add_composite_unit(name, factor, units, offset=0, verbosename='', prefixed=F
         if not isinstance(value, (int, float)):
             raise ValueError('Factor and offset values have to be numeric')
 
-    # Remove unwanted keys from unit_table
-    for key in ['__builtins__', '__args__']:
-        unit_table.pop(key, None)
-
     newunit = copy.deepcopy(baseunit)
     newunit.set_name(name)
     newunit.verbosename = verbosename
@@ -784,12 +1103,12 @@ def add_composite_unit(name, factor, units, offset=0, verbosename='', prefixed=F
     newunit.factor *= factor
     newunit.offset += offset
     unit_table[name] = newunit
+    _clear_caches()
 
     return name
 
 
 # Helper functions
-@lru_cache(maxsize=None)
 def findunit(unitname):
     """ Return PhysicalUnit class if given parameter is a valid unit
 
@@ -813,24 +1132,15 @@ def findunit(unitname):
     >>> findunit('mm')
      <PhysicalUnit mm>
     """
+    if isinstance(unitname, PhysicalUnit):
+        return unitname
     if isinstance(unitname, str):
         if unitname == '':
             raise UnitError('Empty unit name is not valid')
-        name = unitname.strip().replace('^', '**')
-        if name.startswith('1/'):
-            name = '(' + name[2:] + ')**-1'
-        try:
-            unit = eval(name, unit_table)
-        except NameError:
-            raise UnitError('Invalid or unknown unit %s' % name)
-        for cruft in ['__builtins__', '__args__']:
-            try:
-                del unit_table[cruft]
-            except KeyError:
-                pass
+        unit = _parse_unit(unitname)
     else:
         unit = unitname
-    if not isphysicalunit(unit):
+    if not isinstance(unit, PhysicalUnit):
         raise UnitError(f'{str(unit)} is not a unit')
     return unit
 
@@ -861,6 +1171,9 @@ def convertvalue(value, src_unit, target_unit):
     (factor, offset) = src_unit.conversion_tuple_to(target_unit)
     if isinstance(value, list):
         raise UnitError('Cannot convert units for a list')
+    if offset == 0:
+        # only temperatures have an offset, avoid the intermediate array for everything else
+        return value * factor
     return (value + offset) * factor
 
 
@@ -3,11 +3,14 @@ from setuptools import find_packages, setup  # type: ignore
 
 requirements = [
     'numpy',
-    'IPython',
     'wrapt',
     'pytest',
     ]
 
+extras = {
+    'notebook': ['IPython'],
+    }
+
 
 setup(
     name="PhysicalQuantities",
@@ -24,6 +27,7 @@ setup(
 #        'PhysicalQuantities/fractdict.py'
 #    ]),
     install_requires=requirements,
+    extras_require=extras,
     long_description_content_type='text/markdown',
     long_description="""
 *PhysicalQuantities* is a Python module that allows calculations to be aware of physical units. Built-in unit
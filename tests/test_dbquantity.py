@@ -2,8 +2,7 @@ import copy
 
 import numpy as np
 from numpy.testing import assert_almost_equal
-from pytest import raises
-from IPython.core.formatters import PlainTextFormatter
+from pytest import importorskip, raises
 from PhysicalQuantities import PhysicalQuantity
 from PhysicalQuantities.dBQuantity import PhysicalQuantity_to_dBQuantity, dB10, dB20, dBQuantity
 from PhysicalQuantities.unit import UnitError
@@ -658,8 +657,9 @@ def test_neg():
 
 def test_ip_str():
     """IPython formatter"""
+    formatters = importorskip('IPython.core.formatters')
     a = dBQuantity(1.0, 'dBm')
-    a.ptformatter = PlainTextFormatter()
+    a.ptformatter = formatters.PlainTextFormatter()
     a.format = ''
     assert str(a) == '1.0 dBm'
 
@@ -34,6 +34,15 @@ def test_sub():
     assert a-b == c
 
 
+def test_add_order():
+    """ keys of the first operand come first """
+    a = FractionalDict({'m': 1, 'kg': 1})
+    b = FractionalDict({'s': -2, 'm': 1})
+    assert list(a+b) == ['m', 'kg', 's']
+    assert list(a-b) == ['m', 'kg', 's']
+    assert a == {'m': 1, 'kg': 1}
+
+
 def test_mul_1():
     a = FractionalDict({'a': 3, 'b': 2})
     b = Fraction(2)
@@ -20,6 +20,14 @@ def test_floor():
     assert_almost_equal(nw.floor(a).value, np.array([1, 2]))
 
 
+def test_floor_out():
+    a = np.array([1.3, 2.5]) * PhysicalQuantity(1, 'mm')
+    out = np.empty(2)
+    b = nw.floor(a, out=out)
+    assert b.value is out
+    assert_almost_equal(out, np.array([1, 2]))
+
+
 def test_ceil_1():
     a = np.array([1.3, 2.5]) * PhysicalQuantity(1, 'mm')
     assert_almost_equal(nw.ceil(a).value, np.array([2, 3]))
@@ -41,6 +49,16 @@ def test_sqrt_2():
     assert_almost_equal(nw.sqrt(a), np.array([2, 3]))
 
 
+def test_sqrt_3():
+    # units with equal values keep their names, also when cached
+    a = np.array([4, 9]) * PhysicalQuantity(1, 'V**2')
+    b = np.array([4, 9]) * PhysicalQuantity(1, 'W*Ohm')
+    for _ in range(2):
+        assert str(nw.sqrt(a).unit) == 'V'
+        assert str(nw.sqrt(b).unit) == 'm^2*kg/s^3/A'
+    assert nw.sqrt(b).unit == nw.sqrt(a).unit
+
+
 def test_linspace_1():
     a = nw.linspace(PhysicalQuantity(1, 'mm'), PhysicalQuantity(10, 'mm'), 10)
     b = np.linspace(1, 10, 10)
@@ -77,6 +95,13 @@ def test_linspace_6():
     assert_almost_equal(a.value, b)
 
 
+def test_linspace_7():
+    a = nw.linspace(PhysicalQuantity(1, 'mm'), PhysicalQuantity(1, 'cm'), 10)
+    b = np.linspace(1, 10, 10)
+    assert_almost_equal(a.value, b)
+    assert a.unit == PhysicalQuantity(1, 'mm').unit
+
+
 def test_tophysicalquantity_1():
     # conversion of PQ array elements to PQ array
     a = [ PhysicalQuantity(1, 'mm'), PhysicalQuantity(2, 'm'), PhysicalQuantity(3, 'mm')]
@@ -134,6 +159,22 @@ def test_tophysicalquantity_8():
     assert a[0].unit == b.unit
 
 
+def test_tophysicalquantity_9():
+    # mixed prefixes and plain values with given unit
+    a = [PhysicalQuantity(1.5, 'mm'), PhysicalQuantity(2, 'cm'), 3.]
+    b = nw.tophysicalquantity(a, 'mm')
+    assert_almost_equal(b.value, np.array([1.5, 20, 3]))
+    assert b.unit == PhysicalQuantity(1, 'mm').unit
+
+
+def test_tophysicalquantity_10():
+    # elements containing arrays
+    a = [np.array([1., 2.]) * PhysicalQuantity(1, 'mm'), np.array([3., 4.]) * PhysicalQuantity(1, 'm')]
+    b = nw.tophysicalquantity(a)
+    assert b.value.dtype == float
+    assert_almost_equal(b.value, np.array([[1, 2], [3000, 4000]]))
+
+
 def test_argsort_1():
     x = np.array([3, 1, 2])
     y = np.argsort(x)
@@ -1,12 +1,17 @@
+import copy
 import json
+import pickle
+import sys
+import tracemalloc
 
 import numpy as np
-from pytest import raises
+from pytest import importorskip, raises
 from PhysicalQuantities import PhysicalQuantity, units_html_list, units_list
 from PhysicalQuantities.unit import (
-    PhysicalUnit, UnitError, add_composite_unit, addunit, convertvalue,
+    PhysicalUnit, UnitError, _parse_unit, add_composite_unit, addunit, convertvalue,
     findunit, isphysicalunit,
 )
+import PhysicalQuantities.unit as unit_module
 
 
 def test_addunit_1():
@@ -16,6 +21,10 @@ def test_addunit_1():
     assert(type(a.unit) == PhysicalUnit)
 
 
+def test_addunit_3():
+    assert addunit(PhysicalUnit('testunit', 1., [0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0])) == 'testunit'
+
+
 def test_addunit_2():
     with raises(KeyError):
         addunit(PhysicalUnit('degC', 1., [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0], offset=273.15,
@@ -62,6 +71,30 @@ def test_add_composite_unit_6():
         add_composite_unit('test2', 1, '/m')
 
 
+def test_derived_units():
+    derived = {'Hz': '1/s', 'N': 'm*kg/s**2', 'Pa': 'N/m**2', 'J': 'N*m', 'W': 'J/s', 'C': 's*A', 'V': 'W/A',
+               'F': 'C/V', 'Ohm': 'V/A', 'S': 'A/V', 'Wb': 'V*s', 'T': 'Wb/m**2', 'H': 'Wb/A', 'lm': 'cd*sr',
+               'lx': 'lm/m**2'}
+    for name, units in derived.items():
+        a = findunit(name)
+        b = findunit(units)
+        assert a.powers == b.powers
+        assert a.factor == b.factor
+        assert a.baseunit is a
+        assert findunit('k' + name).baseunit is a
+
+
+def test_prefixed_unit():
+    a = findunit('km')
+    b = findunit('m')
+    assert a.prefixed is True
+    assert a.baseunit is b
+    assert a.factor == 1000
+    assert a.powers == b.powers
+    assert a.name == 'km'
+    assert a.verbosename == b.verbosename
+
+
 def test_findunit_1():
     a = findunit('mm')
     b = PhysicalQuantity(1, 'mm').unit
@@ -83,6 +116,48 @@ def test_findunit_4():
         findunit('')
 
 
+def test_findunit_5():
+    """Units added after a lookup must be found"""
+    with raises(UnitError):
+        findunit('findunit_test')
+    add_composite_unit('findunit_test', 2, 'm')
+    assert findunit('findunit_test') is findunit('findunit_test')
+    assert findunit('findunit_test').factor == 2
+
+
+def test_findunit_6():
+    """Unit objects are returned as is, even if an equal unit was looked up before"""
+    add_composite_unit('findunit_m', 1, 'm')
+    a = findunit('m')
+    b = PhysicalQuantity(1, 'findunit_m').unit
+    assert findunit(b) is b
+    assert findunit(b) is not a
+
+
+def test_findunit_7():
+    """Unit strings cannot access builtins and do not modify the unit_table"""
+    from PhysicalQuantities.unit import unit_table
+    with raises(UnitError):
+        findunit('open')
+    findunit('km/h')
+    assert '__builtins__' not in unit_table
+
+
+def test_findunit_8(monkeypatch):
+    """Unit strings are parsed without eval"""
+    def no_eval(*args):
+        raise AssertionError('eval() used for parsing units')
+    _parse_unit.cache_clear()
+    monkeypatch.setattr(unit_module, 'eval', no_eval, raising=False)
+    assert findunit('m*kg/s^2').powers == findunit('N').powers
+    assert findunit('(m / s)**-1').powers == findunit('s/m').powers
+    assert findunit('m**+2/m') == findunit('m')
+    # keywords can be units as well, 'as' is attosecond
+    assert findunit('as').factor == 1e-18
+    with raises(UnitError):
+        findunit('m*xyz')
+
+
 def test_convertvalue():
     a = PhysicalQuantity(1, 'm').unit
     b = PhysicalQuantity(1, 'mm').unit
@@ -90,6 +165,16 @@ def test_convertvalue():
         convertvalue([1], a, b)
 
 
+def test_convertvalue_2():
+    a = PhysicalQuantity(1, 'm').unit
+    b = PhysicalQuantity(1, 'mm').unit
+    value = np.array([1, 2, 3])
+    c = convertvalue(value, a, b)
+    assert np.all(c == [1000, 2000, 3000])
+    assert c is not value
+    assert type(convertvalue(2, a, a)) is float
+
+
 def test_unit_division_1():
     a = PhysicalQuantity(1, 'mm')
     b = PhysicalQuantity(1, 'cm')
@@ -143,16 +228,71 @@ def test_aggregation():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(1, 's')
     c = a*b
-    p = [a.unit.powers[i] + b.unit.powers[i] for i in range(len(a.unit.powers))]
+    p = tuple(a.unit.powers[i] + b.unit.powers[i] for i in range(len(a.unit.powers)))
     assert p == c.unit.powers
 
 
+def test_powers_tuple():
+    a = PhysicalUnit('x', 1., [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
+    assert a.powers == (1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    assert (a*a).powers == (2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+    assert (a/a).is_dimensionless
+    assert (a**3).powers == (3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+
+
+def test_aggregation_names():
+    """Names of unit products are only computed when needed"""
+    a = PhysicalQuantity(1, 'm').unit
+    b = PhysicalQuantity(1, 's').unit
+    ab = a * b
+    assert ab._names is None
+    c = ab / b**2
+    assert c._names is None
+    assert c.names == {'m': 1, 's': -1}
+    assert c._lazy_names is None
+    assert str(c) == 'm/s'
+    assert str(ab) == 'm*s'
+
+
+def test_aggregation_names_2():
+    """Lazy names do not keep the operand units alive"""
+    x = PhysicalQuantity(1., 'm')
+    y = PhysicalQuantity(1.0001, 's')
+    tracemalloc.start()
+    for _ in range(10000):
+        x = x * y / y
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the conversion cache is bounded, a chain of operand units would take ~10 MB here
+    assert size < 1000000
+    assert not any(isinstance(arg, PhysicalUnit) for arg in x.unit._lazy_names.args)
+    assert str(x.unit) == 'm'
+
+
+def test_aggregation_names_3():
+    """Names of a product do not change when an operand is renamed afterwards"""
+    a = copy.deepcopy(findunit('m/s'))
+    b = a * a
+    a.set_name('foo')
+    assert b.name == 'm**2/s**2'
+
+
 def test_conversion_factor_to():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(1, 'mm')
     assert a.unit.conversion_factor_to(b.unit) == 1000
 
 
+def test_conversion_factor_to_2():
+    a = PhysicalQuantity(1, 'J').unit
+    b = PhysicalQuantity(1, 'N*m').unit
+    c = PhysicalQuantity(1, 's').unit
+    assert a.conversion_factor_to(a) == 1.0
+    assert a.conversion_factor_to(b) == 1.0
+    with raises(UnitError):
+        a.conversion_factor_to(c)
+
+
 def test_conversion_tuple_to():
     a = PhysicalQuantity(2, 'm')
     b = PhysicalQuantity(3, 'mm')
@@ -167,6 +307,38 @@ def test_conversion_tuple_to_2():
         assert a.unit.conversion_tuple_to(b.unit) == (1000.0, 0.0)
 
 
+def test_conversion_tuple_to_3():
+    """Conversion tuples are cached and identical units need no conversion"""
+    a = PhysicalQuantity(1, 'm').unit
+    b = PhysicalQuantity(1, 'mm').unit
+    assert a.conversion_tuple_to(a) == (1.0, 0.0)
+    assert a.conversion_tuple_to(b) == (1000.0, 0.0)
+    assert a.conversion_tuple_to(b) == (1000.0, 0.0)
+    assert b.conversion_tuple_to(a) == (0.001, 0.0)
+
+
+def test_slots():
+    a = PhysicalQuantity(1, 'm').unit
+    with raises(AttributeError):
+        a.foo = 1
+
+
+def test_slots_2():
+    """All slots are set, independent of how the unit was created"""
+    for a in (findunit('m'), findunit('km'), findunit('m') * findunit('s')):
+        for name in PhysicalUnit.__slots__:
+            getattr(a, name)
+
+
+def test_pickle():
+    a = PhysicalQuantity(2, 'm') * PhysicalQuantity(3, 'kN')
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        b = pickle.loads(pickle.dumps(a, protocol))
+        assert b == a
+        assert str(b.unit) == 'm*kN'
+        assert b.unit.baseunit is b.unit
+
+
 def test_isphysicalunit():
     a = PhysicalQuantity(1, 'm')
     assert isphysicalunit(a.unit) is True
@@ -179,6 +351,23 @@ def test_repr():
     assert(b == '<PhysicalUnit m>')
 
 
+def test_name():
+    a = copy.deepcopy(PhysicalQuantity(1, 'm**2/s**2').unit)
+    assert a.name == 'm**2/s**2'
+    assert a.name is a.name
+    a.set_name('newname')
+    assert a.name == 'newname'
+
+
+def test_str_cached():
+    a = copy.deepcopy(PhysicalQuantity(1, 'm**2/s').unit)
+    assert str(a) == 'm^2/s'
+    assert a.latex == r'\frac{\text{m}^{2}}{\text{s}}'
+    a.set_name('deg')
+    assert str(a) == 'deg'
+    assert a.latex == r'\,^{\circ}'
+
+
 def test_latex_repr():
     a = PhysicalQuantity(1, 'm').unit
     b = a.latex
@@ -264,11 +453,35 @@ def test_pow_3():
         a**2
 
 
+def test_pow_4():
+    """Inverse integer exponents"""
+    a = PhysicalQuantity(1, 'm^6/s^3').unit
+    assert (a**(1/3)).powers == (2, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0)
+    with raises(UnitError):
+        a**0.25
+    with raises(UnitError):
+        a**1e11
+
+
+def test_pow_5():
+    """Names are rebuilt from base units if they cannot be divided"""
+    a = PhysicalQuantity(1, 'J*kg').unit
+    assert str(a**0.5) == 'm*kg/s'
+
+
 def test_units_html_list():
+    importorskip('IPython')
     a = units_html_list()
     assert(len(a.data) > 1000)
 
 
+def test_units_html_list_2(monkeypatch):
+    """A helpful error is raised without IPython"""
+    monkeypatch.setitem(sys.modules, 'IPython.display', None)
+    with raises(ImportError, match=r'PhysicalQuantities\[notebook\]'):
+        units_html_list()
+
+
 def test_units_list():
     a, b = units_list()
     assert(len(a) > 10)